@@ -0,0 +1,208 @@
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+TRACKER = Path(__file__).resolve().parent / "tracker.py"
+
+
+class TrackerCLITest(unittest.TestCase):
+    # tracker.py keeps config/data next to itself, so each test runs a private copy
+
+    def setUp(self) -> None:
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        shutil.copy(TRACKER, self.dir / "tracker.py")
+
+    def run_tracker(self, *argv: str, stdin: str = "") -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(self.dir / "tracker.py"), *argv],
+            input=stdin, capture_output=True, text=True,
+        )
+
+    def add(self, date: str) -> None:
+        r = self.run_tracker("add", "--date", date, "--start", "10:00", "--end", "11:00",
+                             "--profit", "1", "--stake", "NL2", "--game", "NLH")
+        self.assertEqual(r.returncode, 0, r.stderr)
+
+    def snapshot(self) -> list:
+        return json.loads((self.dir / "sessions.json").read_text(encoding="utf-8"))
+
+    def test_rejected_edit_in_shell_is_not_applied(self) -> None:
+        self.add("2024-03-01")
+        r = self.run_tracker("shell", stdin=(
+            "edit --id 1 --date 2030-05-05 --game XXX\n"
+            "list --from 2024-01-01 --to 2024-12-31\n"
+            "list --from 2030-01-01\n"
+        ))
+        self.assertIn("game must be one of", r.stderr)
+        # 2024 range still lists the session, the 2030 range is empty
+        self.assertIn("2024-03-01", r.stdout)
+        self.assertIn("No sessions found.", r.stdout)
+        self.assertNotIn("2030-05-05", r.stdout)
+        # shell compacts on exit; the rejected date must not reach the snapshot
+        self.assertEqual([s["date"] for s in self.snapshot()], ["2024-03-01"])
+
+    def test_rejected_edit_in_batch_is_not_applied(self) -> None:
+        self.add("2024-03-01")
+        r = self.run_tracker("batch", stdin=(
+            "edit --id 1 --date 2030-05-05 --game XXX\n"
+            "compact\n"
+        ))
+        self.assertEqual(r.returncode, 1)
+        self.assertIn("line 1: game must be one of", r.stderr)
+        self.assertEqual([s["date"] for s in self.snapshot()], ["2024-03-01"])
+
+    def test_torn_journal_tail_is_dropped_before_next_append(self) -> None:
+        self.add("2024-01-01")
+        with (self.dir / "sessions.ndjson").open("ab") as f:
+            f.write(b'{"op":"add","ses')
+        self.add("2024-01-02")
+        r = self.run_tracker("compact")
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertEqual([s["date"] for s in self.snapshot()], ["2024-01-01", "2024-01-02"])
+
+    def test_journal_edit_and_delete_replay_over_snapshot(self) -> None:
+        for d in ("2024-01-01", "2024-01-02", "2024-01-03"):
+            self.add(d)
+        self.assertEqual(self.run_tracker("compact").returncode, 0)
+        r = self.run_tracker("edit", "--id", "2", "--date", "2024-02-02", "--profit", "5")
+        self.assertEqual(r.returncode, 0, r.stderr)
+        r = self.run_tracker("delete", "--id", "3")
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertTrue((self.dir / "sessions.ndjson").exists())
+        self.assertEqual(len(self.snapshot()), 3)
+        # a fresh process replays upd/del from the journal on top of the snapshot
+        r = self.run_tracker("list", "--from", "2024-01-02")
+        self.assertIn("2024-02-02", r.stdout)
+        self.assertNotIn("2024-01-03", r.stdout)
+        self.assertEqual(self.run_tracker("compact").returncode, 0)
+        self.assertFalse((self.dir / "sessions.ndjson").exists())
+        self.assertEqual([(s["id"], s["date"], s["profit"]) for s in self.snapshot()],
+                         [(1, "2024-01-01", 1.0), (2, "2024-02-02", 5.0)])
+
+    def test_deleted_highest_id_is_reused(self) -> None:
+        self.add("2024-01-01")
+        self.add("2024-01-02")
+        self.assertEqual(self.run_tracker("delete", "--id", "2").returncode, 0)
+        # same as baseline next_id: max remaining id + 1, also after journal replay
+        self.add("2024-01-03")
+        r = self.run_tracker("shell", stdin=(
+            "delete --id 2\n"
+            "add --date 2024-01-04 --start 10:00 --end 11:00 --profit 1 --stake NL2 --game NLH\n"
+        ))
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertEqual([(s["id"], s["date"]) for s in self.snapshot()],
+                         [(1, "2024-01-01"), (2, "2024-01-04")])
+
+    def test_export_is_in_id_order_after_compact(self) -> None:
+        for d in ("2024-01-03", "2024-01-01", "2024-01-02"):
+            self.add(d)
+        self.assertEqual(self.run_tracker("compact").returncode, 0)
+        out = self.dir / "out.csv"
+        r = self.run_tracker("export", "--out", str(out))
+        self.assertEqual(r.returncode, 0, r.stderr)
+        rows = out.read_text(encoding="utf-8").splitlines()[1:]
+        self.assertEqual([row.split(",")[0] for row in rows], ["1", "2", "3"])
+
+    def test_date_range_bounds_are_inclusive(self) -> None:
+        dates = ("2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05")
+        for d in dates:
+            self.add(d)
+        r = self.run_tracker("list", "--from", "2024-01-02", "--to", "2024-01-04")
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertEqual([d for d in dates if d in r.stdout], list(dates[1:4]))
+        r = self.run_tracker("list", "--from", "2024-01-05", "--to", "2024-01-05")
+        self.assertIn("2024-01-05", r.stdout)
+        self.assertNotIn("2024-01-04", r.stdout)
+        r = self.run_tracker("list", "--to", "2023-12-31")
+        self.assertIn("No sessions found.", r.stdout)
+        r = self.run_tracker("list", "--from", "2024-01-06")
+        self.assertIn("No sessions found.", r.stdout)
+
+    def test_list_order_and_limit_follow_adds_and_edits_in_shell(self) -> None:
+        self.add("2024-01-02")
+        self.add("2024-01-04")
+        add = "add --start 10:00 --end 11:00 --profit 1 --stake NL2 --game NLH --date"
+        r = self.run_tracker("shell", stdin=(
+            "list\n"  # builds the sorted view before the changes below
+            f"{add} 2024-01-03\n"
+            f"{add} 2024-01-01\n"
+            "edit --id 2 --date 2024-01-05\n"
+            "list --asc --limit 2\n"
+            "list --desc --limit 2\n"
+        ))
+        self.assertEqual(r.returncode, 0, r.stderr)
+        after_edit = r.stdout.split("Updated session #2")[1].splitlines()
+        ids = [line.split("|")[0].strip() for line in after_edit if line[:1].isdigit()]
+        # --asc: 2024-01-01 (#4), 2024-01-02 (#1); --desc: 2024-01-05 (#2), 2024-01-03 (#3)
+        self.assertEqual(ids, ["4", "1", "2", "3"])
+
+    def test_stake_filter_matches_legacy_mixed_case_stake(self) -> None:
+        (self.dir / "sessions.json").write_text(json.dumps([{
+            "id": 1, "room": "PokerOK", "date": "2024-01-01", "start_time": "10:00",
+            "end_time": "11:00", "duration_min": 60, "stake": "Home5", "game": "nlh",
+            "profit": 1.0, "currency": "USD",
+        }]), encoding="utf-8")
+        r = self.run_tracker("list", "--stake", "home5", "--game", "NLH")
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertNotIn("No sessions found.", r.stdout)
+        # the stake is shown and stored as entered
+        self.assertIn("Home5", r.stdout)
+        self.assertEqual(self.run_tracker("compact").returncode, 0)
+        self.assertEqual(self.snapshot()[0]["stake"], "Home5")
+
+    def test_bad_stored_date_can_be_repaired(self) -> None:
+        (self.dir / "sessions.json").write_text(json.dumps([{
+            "id": 1, "room": "PokerOK", "date": "2024-1-5", "start_time": "10:00",
+            "end_time": "11:00", "duration_min": 60, "stake": "NL2", "game": "NLH",
+            "profit": 1.0, "currency": "USD",
+        }]), encoding="utf-8")
+        r = self.run_tracker("list")
+        self.assertEqual(r.returncode, 1)
+        self.assertIn("invalid stored date: '2024-1-5'", r.stderr)
+        r = self.run_tracker("export", "--out", str(self.dir / "out.csv"))
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertIn("2024-1-5", (self.dir / "out.csv").read_text(encoding="utf-8"))
+        r = self.run_tracker("edit", "--id", "1", "--date", "2024-01-05")
+        self.assertEqual(r.returncode, 0, r.stderr)
+        r = self.run_tracker("list")
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertIn("2024-01-05", r.stdout)
+
+    def test_snapshot_not_one_record_per_line_still_loads(self) -> None:
+        record = json.dumps({
+            "id": 1, "room": "PokerOK", "date": "2024-01-01", "start_time": "10:00",
+            "end_time": "11:00", "duration_min": 60, "stake": "NL2", "game": "NLH",
+            "profit": 1.0, "currency": "USD",
+        })
+        (self.dir / "sessions.json").write_text(f"[\n{record}]\n", encoding="utf-8")
+        r = self.run_tracker("list")
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertIn("2024-01-01", r.stdout)
+
+    def test_non_finite_profit_and_huge_counts_are_rejected(self) -> None:
+        base = ("add", "--date", "2024-01-01", "--start", "10:00", "--end", "11:00",
+                "--stake", "NL2", "--game", "NLH")
+        for extra in (("--profit", "nan"), ("--profit", "inf"), ("--profit", "-inf"),
+                      ("--profit", "1", "--hands", str(2**63))):
+            r = self.run_tracker(*base, *extra)
+            self.assertEqual(r.returncode, 2, extra)
+            self.assertNotIn("Traceback", r.stderr)
+        r = self.run_tracker("list")
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertIn("No sessions found.", r.stdout)
+
+    def test_batch_rejects_prompting_add(self) -> None:
+        r = self.run_tracker("batch", stdin="add --date 2024-01-01\nlist\n")
+        self.assertEqual(r.returncode, 1)
+        self.assertIn("line 1: add needs", r.stderr)
+        self.assertNotIn("Traceback", r.stderr)
+        self.assertIn("No sessions found.", r.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,14 +4,27 @@
 from __future__ import annotations
 
 import argparse
+import bisect
 import csv
+import functools
+import heapq
 import json
+import math
+import mmap
+import os
 import re
+import shlex
 import sys
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime, date, time, timedelta, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to stdlib json
+    orjson = None
 
 
 # ---------------------------
@@ -29,8 +42,16 @@ DEFAULT_CONFIG = {
 ALLOWED_GAMES = {"NLH", "PLO"}
 
 STAKE_RE = re.compile(r"^(NL|PLO)\d+$", re.IGNORECASE)
-DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-TIME_RE = re.compile(r"^\d{2}:\d{2}$")
+
+# orjson only serializes integers that fit in 64 bits
+MAX_STORED_INT = 2**63 - 1
+
+# add prompts interactively when any of these is missing
+ADD_REQUIRED = ("date", "start", "end", "profit", "stake", "game")
+
+# C-level sort keys (no Python lambda call per element)
+SESSION_SORT_KEY = attrgetter("date", "start_time", "id")
+PROFIT_KEY = attrgetter("profit")
 
 
 # ---------------------------
@@ -50,7 +71,7 @@ def die(msg: str, code: int = 1) -> None:
 # Data model
 # ---------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     id: int
     room: str
@@ -67,13 +88,88 @@ class Session:
     notes: Optional[str] = None
     created_at: str = ""
     updated_at: str = ""
+    # date as ordinal, cached for filter_sessions; not persisted (orjson skips "_" fields)
+    _date_ord: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            self._date_ord = date_ordinal(self.date)
+        except TrackerError:
+            # keep loading so the row can still be edited/deleted/exported;
+            # in_date_range reports it when a command filters by date
+            self._date_ord = 0
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "Session":
         return Session(**d)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {name: getattr(self, name) for name in SESSION_FIELDS}
+
+
+# persisted / exported fields, in declaration order
+SESSION_FIELDS = tuple(f.name for f in fields(Session) if f.init)
+
+
+class SessionStore:
+    """Sessions indexed by id (insertion order preserved), plus a date-sorted view."""
+
+    def __init__(self, sessions: Iterable[Session] = ()) -> None:
+        self.by_id: Dict[int, Session] = {}
+        self.max_id = 0
+        # sorted by SESSION_SORT_KEY with parallel date ordinals; built lazily by in_date_range
+        self._sorted: Optional[List[Session]] = None
+        self._ords: List[int] = []
+        for s in sessions:
+            self.add(s)
+
+    def __iter__(self) -> Iterator[Session]:
+        return iter(self.by_id.values())
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def add(self, s: Session) -> None:
+        # also used to replace an existing id (keeps its position) or re-index an edited one
+        replaced = s.id in self.by_id
+        self.by_id[s.id] = s
+        if s.id > self.max_id:
+            self.max_id = s.id
+        if self._sorted is not None:
+            if replaced:
+                self._sorted = None  # sort key may have changed; rebuild on next query
+            else:
+                i = bisect.bisect_right(self._sorted, SESSION_SORT_KEY(s), key=SESSION_SORT_KEY)
+                self._sorted.insert(i, s)
+                self._ords.insert(i, s._date_ord)
+
+    def remove(self, sid: int) -> bool:
+        s = self.by_id.pop(sid, None)
+        if s is None:
+            return False
+        if sid == self.max_id:
+            self.max_id = max(self.by_id, default=0)
+        if self._sorted is not None:
+            i = bisect.bisect_left(self._sorted, SESSION_SORT_KEY(s), key=SESSION_SORT_KEY)
+            if i < len(self._sorted) and self._sorted[i] is s:
+                del self._sorted[i]
+                del self._ords[i]
+            else:
+                self._sorted = None
+        return True
+
+    def in_date_range(self, fd: Optional[int], td: Optional[int]) -> List[Session]:
+        # sessions with fd <= date ordinal <= td, in SESSION_SORT_KEY order (O(log N) lookup)
+        if self._sorted is None:
+            view = sorted(self.by_id.values(), key=SESSION_SORT_KEY)
+            ords = [s._date_ord for s in view]
+            if 0 in ords:
+                # stored date that failed to parse on load; raises "invalid stored date"
+                date_ordinal(view[ords.index(0)].date)
+            self._sorted, self._ords = view, ords
+        lo = 0 if fd is None else bisect.bisect_left(self._ords, fd)
+        hi = len(self._ords) if td is None else bisect.bisect_right(self._ords, td)
+        return self._sorted[lo:hi]
 
 
 # ---------------------------
@@ -84,13 +180,29 @@ def script_dir() -> Path:
     return Path(__file__).resolve().parent
 
 
+def json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    # compact by default (files are machine-read); dataclasses (Session) are
+    # serialized directly, no to_dict() pass needed
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=Session.to_dict).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=Session.to_dict).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def load_or_init_config(cfg_path: Path) -> Dict[str, Any]:
     if not cfg_path.exists():
-        cfg_path.write_text(json.dumps(DEFAULT_CONFIG, ensure_ascii=False, indent=2), encoding="utf-8")
+        cfg_path.write_bytes(json_dumps(DEFAULT_CONFIG))
         return dict(DEFAULT_CONFIG)
 
     try:
-        cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
+        cfg = json_loads(cfg_path.read_bytes())
         if not isinstance(cfg, dict):
             raise ValueError("config is not an object")
     except Exception as e:
@@ -99,35 +211,112 @@ def load_or_init_config(cfg_path: Path) -> Dict[str, Any]:
     # merge defaults (forward-compatible)
     merged = dict(DEFAULT_CONFIG)
     merged.update(cfg)
-    # persist merged if new keys added
-    if merged != cfg:
-        cfg_path.write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+    # persist merged if new keys added (key check only; cfg values always win)
+    if DEFAULT_CONFIG.keys() - cfg.keys():
+        cfg_path.write_bytes(json_dumps(merged))
     return merged
 
 
-def load_or_init_sessions(data_path: Path) -> List[Session]:
-    if not data_path.exists():
-        data_path.write_text("[]", encoding="utf-8")
-        return []
+def journal_path(data_path: Path) -> Path:
+    # sessions.json -> sessions.ndjson; never the data file itself (data_file=*.ndjson)
+    jpath = data_path.with_suffix(".ndjson")
+    if jpath == data_path:
+        jpath = data_path.with_name(data_path.name + ".journal")
+    return jpath
 
-    try:
-        raw = json.loads(data_path.read_text(encoding="utf-8"))
+
+def iter_snapshot_lines(mm: mmap.mmap) -> Iterator[Dict[str, Any]]:
+    # records written by save_sessions: "[", then one session per line, then "]"
+    mm.seek(0)
+    if mm.readline().rstrip() != b"[":
+        raise ValueError("not one record per line")
+    for line in iter(mm.readline, b""):
+        line = line.rstrip().rstrip(b",")
+        if line == b"]":
+            return
+        yield json_loads(line)
+    raise ValueError("unterminated JSON array")
+
+
+def load_snapshot(data_path: Path) -> SessionStore:
+    # mmap: lines are sliced from the page cache instead of read() into buffers
+    with data_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # the one-record-per-line layout is parsed line by line; any other valid
+        # JSON array (older pretty-printed or hand-edited files) is parsed whole
+        try:
+            return SessionStore(Session.from_dict(x) for x in iter_snapshot_lines(mm))
+        except ValueError:
+            pass
+        raw = json_loads(mm[:])
         if not isinstance(raw, list):
             raise ValueError("sessions.json is not a list")
-        return [Session.from_dict(x) for x in raw]
-    except Exception as e:
-        raise TrackerError(f"Failed to read {data_path.name}: {e}")
+        return SessionStore(Session.from_dict(x) for x in raw)
 
 
-def save_sessions(data_path: Path, sessions: List[Session]) -> None:
-    data_path.write_text(
-        json.dumps([s.to_dict() for s in sessions], ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+def load_or_init_sessions(data_path: Path) -> SessionStore:
+    if not data_path.exists():
+        data_path.write_text("[]", encoding="utf-8")
 
+    try:
+        sessions = load_snapshot(data_path)
+    except Exception as e:
+        raise TrackerError(f"Failed to read {data_path.name}: {e}")
 
-def next_id(sessions: List[Session]) -> int:
-    return (max((s.id for s in sessions), default=0) + 1)
+    jpath = journal_path(data_path)
+    if jpath.exists():
+        try:
+            complete = 0  # bytes up to the last newline-terminated record
+            torn = False
+            with jpath.open("rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        torn = True  # torn write from an interrupted append
+                        break
+                    complete += len(line)
+                    rec = json_loads(line)
+                    op = rec["op"]
+                    if op in ("add", "upd"):
+                        sessions.add(Session.from_dict(rec["session"]))
+                    elif op == "del":
+                        sessions.remove(rec["id"])
+                    else:
+                        raise ValueError(f"unknown journal op: {op}")
+            if torn:
+                # drop the fragment so the next append starts on a fresh line
+                os.truncate(jpath, complete)
+        except Exception as e:
+            raise TrackerError(f"Failed to read {jpath.name}: {e}")
+
+    return sessions
+
+
+def append_journal(data_path: Path, record: Dict[str, Any]) -> None:
+    # O(1) per mutation: one line appended instead of rewriting the whole file
+    with journal_path(data_path).open("ab") as f:
+        f.write(json_dumps(record) + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def save_sessions(data_path: Path, sessions: SessionStore) -> None:
+    tmp_path = data_path.with_name(data_path.name + ".tmp")
+    # still a plain JSON array, written one session per line (see iter_snapshot_lines)
+    # in SESSION_SORT_KEY order, so the next load's sort in in_date_range is a presorted pass
+    with tmp_path.open("wb") as f:
+        sep = b"[\n"
+        for s in sorted(sessions, key=SESSION_SORT_KEY):
+            f.write(sep + json_dumps(s))
+            sep = b",\n"
+        f.write(b"\n]\n" if sessions else b"[]\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, data_path)
+    # snapshot now holds every journaled change
+    journal_path(data_path).unlink(missing_ok=True)
+
+
+def next_id(sessions: SessionStore) -> int:
+    return sessions.max_id + 1
 
 
 # ---------------------------
@@ -135,19 +324,30 @@ def next_id(sessions: List[Session]) -> int:
 # ---------------------------
 
 def parse_date_str(s: str) -> date:
-    if not DATE_RE.match(s):
+    # plain shape check instead of a regex match (isdecimal() is what \d matches)
+    if not (len(s) == 10 and s[4] == "-" and s[7] == "-"
+            and s[:4].isdecimal() and s[5:7].isdecimal() and s[8:].isdecimal()):
         raise TrackerError("date must be in YYYY-MM-DD format")
     try:
-        return datetime.strptime(s, "%Y-%m-%d").date()
+        return date(int(s[:4]), int(s[5:7]), int(s[8:]))
     except ValueError:
         raise TrackerError("invalid date value")
 
 
+@functools.lru_cache(maxsize=4096)
+def date_ordinal(s: str) -> int:
+    # hot path for stored (already validated) YYYY-MM-DD dates: no regex, no strptime
+    try:
+        return date(int(s[0:4]), int(s[5:7]), int(s[8:10])).toordinal()
+    except ValueError:
+        raise TrackerError(f"invalid stored date: {s!r}")
+
+
 def parse_time_str(s: str) -> time:
-    if not TIME_RE.match(s):
+    if not (len(s) == 5 and s[2] == ":" and s[:2].isdecimal() and s[3:].isdecimal()):
         raise TrackerError("time must be in HH:MM format")
     try:
-        return datetime.strptime(s, "%H:%M").time()
+        return time(int(s[:2]), int(s[3:]))
     except ValueError:
         raise TrackerError("invalid time value")
 
@@ -173,9 +373,13 @@ def validate_stake(stake: str) -> str:
 
 def parse_float(s: str) -> float:
     try:
-        return float(s)
+        v = float(s)
     except ValueError:
         raise TrackerError("profit must be a number (e.g., 12.5 or -7.25)")
+    # nan/inf have no JSON form (orjson writes them as null)
+    if not math.isfinite(v):
+        raise TrackerError("profit must be a finite number")
+    return v
 
 
 def parse_nonneg_int(s: str, field_name: str) -> int:
@@ -185,21 +389,25 @@ def parse_nonneg_int(s: str, field_name: str) -> int:
         raise TrackerError(f"{field_name} must be an integer")
     if v < 0:
         raise TrackerError(f"{field_name} must be >= 0")
+    if v > MAX_STORED_INT:
+        raise TrackerError(f"{field_name} must be <= {MAX_STORED_INT}")
     return v
 
 
+def arg_type(convert: Callable[[str], Any]) -> Callable[[str], Any]:
+    # adapt a parse_* helper for argparse type=, so values arrive already validated
+    def parse(raw: str) -> Any:
+        try:
+            return convert(raw)
+        except TrackerError as e:
+            raise argparse.ArgumentTypeError(str(e))
+    return parse
+
+
 def calc_duration_minutes(start_hm: str, end_hm: str) -> int:
-    st = parse_time_str(start_hm)
-    en = parse_time_str(end_hm)
-    # anchor at arbitrary date
-    base = date(2000, 1, 1)
-    dt_start = datetime.combine(base, st)
-    dt_end = datetime.combine(base, en)
-    if dt_end < dt_start:
-        dt_end += timedelta(days=1)
-    delta = dt_end - dt_start
-    mins = int(round(delta.total_seconds() / 60.0))
-    return max(mins, 0)
+    # inputs are validated HH:MM strings; end < start means the session crossed midnight
+    delta = (int(end_hm[:2]) * 60 + int(end_hm[3:5])) - (int(start_hm[:2]) * 60 + int(start_hm[3:5]))
+    return delta if delta >= 0 else delta + 1440
 
 
 def now_iso_local() -> str:
@@ -244,34 +452,39 @@ def fmt_duration(mins: int) -> str:
     return f"{m}m"
 
 
-def print_table(rows: List[List[str]], headers: List[str]) -> None:
+def print_table(rows: List[Tuple[str, ...]], headers: List[str]) -> None:
     if not rows:
         print("No sessions found.")
         return
-    cols = list(zip(*([headers] + rows)))
-    widths = [max(len(str(x)) for x in col) for col in cols]
-    def line(items: List[str]) -> str:
-        return " | ".join(str(items[i]).ljust(widths[i]) for i in range(len(items)))
-    print(line(headers))
-    print("-+-".join("-" * w for w in widths))
-    for r in rows:
-        print(line(r))
-
-
-def session_row(s: Session) -> List[str]:
-    start_end = f"{s.start_time}-{s.end_time}"
-    return [
+    cols = zip(headers, *rows)
+    widths = [max(map(len, col)) for col in cols]
+    fmt = " | ".join(f"{{:<{w}}}" for w in widths)
+    out = [fmt.format(*headers), "-+-".join("-" * w for w in widths)]
+    out.extend(fmt.format(*r) for r in rows)
+    # one write for the whole table instead of a print() per row
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def session_row(s: Session) -> Tuple[str, ...]:
+    notes = s.notes
+    if not notes:
+        notes = ""
+    elif len(notes) > 30:
+        notes = notes[:27] + "..."
+    hands = s.hands
+    tables = s.tables
+    return (
         str(s.id),
         s.date,
         s.stake,
         s.game,
-        start_end,
+        f"{s.start_time}-{s.end_time}",
         str(s.duration_min),
         f"{fmt_money(s.profit)} {s.currency}",
-        "" if s.hands is None else str(s.hands),
-        "" if s.tables is None else str(s.tables),
-        "" if not s.notes else (s.notes if len(s.notes) <= 30 else s.notes[:27] + "..."),
-    ]
+        "" if hands is None else str(hands),
+        "" if tables is None else str(tables),
+        notes,
+    )
 
 
 # ---------------------------
@@ -279,7 +492,7 @@ def session_row(s: Session) -> List[str]:
 # ---------------------------
 
 def filter_sessions(
-    sessions: List[Session],
+    sessions: SessionStore,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
     stake: Optional[str] = None,
@@ -290,13 +503,14 @@ def filter_sessions(
     st = stake.strip().upper() if stake else None
     gm = game.strip().upper() if game else None
 
+    # date window found by bisect; result is sorted by SESSION_SORT_KEY
+    candidates = sessions.in_date_range(fd, td)
+    if st is None and gm is None:
+        return candidates
+
     out: List[Session] = []
-    for s in sessions:
-        d_ord = parse_date_str(s.date).toordinal()
-        if fd is not None and d_ord < fd:
-            continue
-        if td is not None and d_ord > td:
-            continue
+    for s in candidates:
+        # stored as entered (e.g. "Home5"), so compare case-insensitively
         if st is not None and s.stake.strip().upper() != st:
             continue
         if gm is not None and s.game.strip().upper() != gm:
@@ -338,30 +552,33 @@ def compute_period_range(period: str) -> Tuple[str, str]:
 # Commands implementation
 # ---------------------------
 
-def cmd_add(args: argparse.Namespace, cfg: Dict[str, Any], sessions: List[Session], data_path: Path) -> None:
+def cmd_add(args: argparse.Namespace, cfg: Dict[str, Any], sessions: SessionStore, data_path: Path) -> None:
     # Determine whether to prompt interactively
-    interactive = any(getattr(args, k) is None for k in ["date", "start", "end", "profit", "stake", "game"])
+    interactive = any(getattr(args, k) is None for k in ADD_REQUIRED)
 
     if interactive:
         print("Interactive add mode (PokerOK)")
-        d = prompt_input("Date (YYYY-MM-DD)", lambda x: parse_date_str(x).strftime("%Y-%m-%d"))
-        st = prompt_input("Start time (HH:MM)", lambda x: parse_time_str(x).strftime("%H:%M"))
-        en = prompt_input("End time (HH:MM)", lambda x: parse_time_str(x).strftime("%H:%M"))
-        pr = prompt_input("Profit", parse_float)
-        sk = prompt_input("Stake (e.g., NL10 / PLO25)", validate_stake)
-        gm = prompt_input("Game (NLH/PLO)", validate_game)
-        hands = prompt_input("Hands (optional)", lambda x: parse_nonneg_int(x, "hands"), optional=True)
-        tables = prompt_input("Tables (optional)", lambda x: parse_nonneg_int(x, "tables"), optional=True)
-        notes = input("Notes (optional): ").strip() or None
+        try:
+            d = prompt_input("Date (YYYY-MM-DD)", lambda x: parse_date_str(x).strftime("%Y-%m-%d"))
+            st = prompt_input("Start time (HH:MM)", lambda x: parse_time_str(x).strftime("%H:%M"))
+            en = prompt_input("End time (HH:MM)", lambda x: parse_time_str(x).strftime("%H:%M"))
+            pr = prompt_input("Profit", parse_float)
+            sk = prompt_input("Stake (e.g., NL10 / PLO25)", validate_stake)
+            gm = prompt_input("Game (NLH/PLO)", validate_game)
+            hands = prompt_input("Hands (optional)", lambda x: parse_nonneg_int(x, "hands"), optional=True)
+            tables = prompt_input("Tables (optional)", lambda x: parse_nonneg_int(x, "tables"), optional=True)
+            notes = input("Notes (optional): ").strip() or None
+        except EOFError:
+            raise TrackerError("input ended before all session fields were entered")
     else:
         d = parse_date_str(args.date).strftime("%Y-%m-%d")
         st = parse_time_str(args.start).strftime("%H:%M")
         en = parse_time_str(args.end).strftime("%H:%M")
-        pr = parse_float(str(args.profit))
+        pr = args.profit
         sk = validate_stake(args.stake)
         gm = validate_game(args.game)
-        hands = args.hands if args.hands is None else parse_nonneg_int(str(args.hands), "hands")
-        tables = args.tables if args.tables is None else parse_nonneg_int(str(args.tables), "tables")
+        hands = args.hands
+        tables = args.tables
         notes = args.notes.strip() if args.notes else None
         if notes == "":
             notes = None
@@ -387,23 +604,25 @@ def cmd_add(args: argparse.Namespace, cfg: Dict[str, Any], sessions: List[Sessio
         created_at=ts,
         updated_at=ts,
     )
-    sessions.append(s)
-    save_sessions(data_path, sessions)
+    # journal first (as cmd_edit does): a failed write leaves the store untouched
+    append_journal(data_path, {"op": "add", "session": s})
+    sessions.add(s)
 
     print(f"Added session #{s.id}: {s.date} {s.stake} {s.game} {s.start_time}-{s.end_time} "
           f"({s.duration_min}m) Profit: {fmt_money(s.profit)} {s.currency}")
 
 
-def cmd_list(args: argparse.Namespace, sessions: List[Session]) -> None:
+def cmd_list(args: argparse.Namespace, sessions: SessionStore) -> None:
     filtered = filter_sessions(sessions, args.from_date, args.to_date, args.stake, args.game)
-    reverse = True
-    if args.asc:
-        reverse = False
-    filtered.sort(key=lambda s: (s.date, s.start_time, s.id), reverse=reverse)
 
+    # filtered is already in ascending SESSION_SORT_KEY order
     limit = args.limit
-    if limit is not None and limit >= 0:
+    if limit is None or limit < 0:
+        limit = len(filtered)
+    if args.asc:
         filtered = filtered[:limit]
+    else:
+        filtered = filtered[max(len(filtered) - limit, 0):][::-1]
 
     headers = ["id", "date", "stake", "game", "start-end", "dur_min", "profit", "hands", "tables", "notes"]
     rows = [session_row(s) for s in filtered]
@@ -412,18 +631,27 @@ def cmd_list(args: argparse.Namespace, sessions: List[Session]) -> None:
 
 def compute_stats_block(sessions: List[Session]) -> Dict[str, Any]:
     count = len(sessions)
-    total_profit = sum(s.profit for s in sessions)
-    total_min = sum(s.duration_min for s in sessions)
+    # one pass over the sessions instead of a separate sum() per column
+    total_profit = 0.0
+    total_min = 0
+    hands_total = 0
+    hands_known = False
+    for s in sessions:
+        total_profit += s.profit
+        total_min += s.duration_min
+        if s.hands is not None:
+            hands_total += s.hands
+            hands_known = True
+
     avg_profit = (total_profit / count) if count else 0.0
     total_hours = total_min / 60.0 if total_min else 0.0
     profit_per_hour = (total_profit / total_hours) if total_hours > 0 else 0.0
 
-    hands_total = sum((s.hands or 0) for s in sessions)
-    hands_known = any(s.hands is not None for s in sessions)
     hands_per_hour = (hands_total / total_hours) if (hands_known and total_hours > 0) else None
 
-    best = sorted(sessions, key=lambda s: s.profit, reverse=True)[:3]
-    worst = sorted(sessions, key=lambda s: s.profit)[:3]
+    # partial selection, same order as sorted(...)[:3]
+    best = heapq.nlargest(3, sessions, key=PROFIT_KEY)
+    worst = heapq.nsmallest(3, sessions, key=PROFIT_KEY)
 
     return {
         "count": count,
@@ -438,33 +666,38 @@ def compute_stats_block(sessions: List[Session]) -> Dict[str, Any]:
     }
 
 
-def print_stats(title: str, block: Dict[str, Any], currency: str) -> None:
-    print(f"\n{title}")
-    print("-" * len(title))
-    print(f"Sessions: {block['count']}")
-    print(f"Total profit: {fmt_money(block['total_profit'])} {currency}")
-    print(f"Avg profit/session: {fmt_money(block['avg_profit'])} {currency}")
-    print(f"Total duration: {fmt_duration(block['total_min'])} ({block['total_min']} min)")
-    print(f"Profit/hour: {fmt_money(block['profit_per_hour'])} {currency}/h")
+def format_stats(title: str, block: Dict[str, Any], currency: str) -> List[str]:
+    out = [
+        "",
+        title,
+        "-" * len(title),
+        f"Sessions: {block['count']}",
+        f"Total profit: {fmt_money(block['total_profit'])} {currency}",
+        f"Avg profit/session: {fmt_money(block['avg_profit'])} {currency}",
+        f"Total duration: {fmt_duration(block['total_min'])} ({block['total_min']} min)",
+        f"Profit/hour: {fmt_money(block['profit_per_hour'])} {currency}/h",
+    ]
     if block["hands_total"] is not None:
-        print(f"Hands (total): {block['hands_total']}")
+        out.append(f"Hands (total): {block['hands_total']}")
         if block["hands_per_hour"] is not None:
-            print(f"Hands/hour: {block['hands_per_hour']:.0f}")
+            out.append(f"Hands/hour: {block['hands_per_hour']:.0f}")
 
     def show_list(label: str, items: List[Session]) -> None:
-        print(f"\n{label}:")
+        out.append("")
+        out.append(f"{label}:")
         if not items:
-            print("  (none)")
+            out.append("  (none)")
             return
         for s in items:
-            print(f"  #{s.id} {s.date} {s.stake} {s.game} {fmt_money(s.profit)} {s.currency}")
+            out.append(f"  #{s.id} {s.date} {s.stake} {s.game} {fmt_money(s.profit)} {s.currency}")
 
     show_list("Top 3 best sessions", block["best"])
     show_list("Top 3 worst sessions", block["worst"])
-    print("")
+    out.append("")
+    return out
 
 
-def cmd_stats(args: argparse.Namespace, cfg: Dict[str, Any], sessions: List[Session]) -> None:
+def cmd_stats(args: argparse.Namespace, cfg: Dict[str, Any], sessions: SessionStore) -> None:
     if args.from_date or args.to_date:
         fd = args.from_date
         td = args.to_date
@@ -479,124 +712,123 @@ def cmd_stats(args: argparse.Namespace, cfg: Dict[str, Any], sessions: List[Sess
     else:
         fd, td = compute_period_range(args.period)
 
-    filtered = filter_sessions(sessions, fd, td, args.stake, args.game)
-    filtered.sort(key=lambda s: (s.date, s.start_time, s.id))
+    filtered = filter_sessions(sessions, fd, td, args.stake, args.game)  # sorted by SESSION_SORT_KEY
 
     currency = str(cfg.get("currency", "USD"))
     title = f"Stats for {fd} .. {td}"
     overall = compute_stats_block(filtered)
-    print_stats(title, overall, currency)
-
-    by = (args.by or "").strip().lower()
-    if by in ("stake", "game") and filtered:
-        groups: Dict[str, List[Session]] = {}
-        for s in filtered:
-            key = s.stake if by == "stake" else s.game
-            groups.setdefault(key, []).append(s)
-
-        for key in sorted(groups.keys()):
-            blk = compute_stats_block(groups[key])
-            print_stats(f"Group: {by} = {key}", blk, currency)
-    elif args.by:
-        raise TrackerError("--by must be one of: stake, game")
-
+    out = format_stats(title, overall, currency)
 
-def find_session_by_id(sessions: List[Session], sid: int) -> Session:
-    for s in sessions:
-        if s.id == sid:
-            return s
-    raise TrackerError(f"session id {sid} not found")
+    try:
+        by = (args.by or "").strip().lower()
+        if by in ("stake", "game") and filtered:
+            groups: Dict[str, List[Session]] = {}
+            for s in filtered:
+                key = s.stake if by == "stake" else s.game
+                groups.setdefault(key, []).append(s)
+
+            for key in sorted(groups.keys()):
+                blk = compute_stats_block(groups[key])
+                out.extend(format_stats(f"Group: {by} = {key}", blk, currency))
+        elif args.by:
+            raise TrackerError("--by must be one of: stake, game")
+    finally:
+        # one write for the whole report instead of a print() per line
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+def find_session_by_id(sessions: SessionStore, sid: int) -> Session:
+    try:
+        return sessions.by_id[sid]
+    except KeyError:
+        raise TrackerError(f"session id {sid} not found")
 
 
-def cmd_edit(args: argparse.Namespace, cfg: Dict[str, Any], sessions: List[Session], data_path: Path) -> None:
+def cmd_edit(args: argparse.Namespace, cfg: Dict[str, Any], sessions: SessionStore, data_path: Path) -> None:
     sid = args.id
     s = find_session_by_id(sessions, sid)
 
-    changed = False
+    # validate everything first; the stored session is only replaced once all fields pass
+    # (batch/shell keep the same SessionStore across commands)
+    changes: Dict[str, Any] = {}
 
     if args.date is not None:
-        s.date = parse_date_str(args.date).strftime("%Y-%m-%d")
-        changed = True
+        changes["date"] = parse_date_str(args.date).strftime("%Y-%m-%d")
     if args.start is not None:
-        s.start_time = parse_time_str(args.start).strftime("%H:%M")
-        changed = True
+        changes["start_time"] = parse_time_str(args.start).strftime("%H:%M")
     if args.end is not None:
-        s.end_time = parse_time_str(args.end).strftime("%H:%M")
-        changed = True
+        changes["end_time"] = parse_time_str(args.end).strftime("%H:%M")
     if args.profit is not None:
-        s.profit = parse_float(str(args.profit))
-        changed = True
+        changes["profit"] = args.profit
     if args.stake is not None:
-        s.stake = validate_stake(args.stake)
-        changed = True
+        changes["stake"] = validate_stake(args.stake)
     if args.game is not None:
-        s.game = validate_game(args.game)
-        changed = True
+        changes["game"] = validate_game(args.game)
     if args.hands is not None:
-        s.hands = parse_nonneg_int(str(args.hands), "hands")
-        changed = True
+        changes["hands"] = args.hands
     if args.tables is not None:
-        s.tables = parse_nonneg_int(str(args.tables), "tables")
-        changed = True
+        changes["tables"] = args.tables
     if args.notes is not None:
-        s.notes = args.notes.strip() or None
-        changed = True
+        changes["notes"] = args.notes.strip() or None
 
     # If any of start/end updated, recompute duration
     if args.start is not None or args.end is not None:
-        s.duration_min = calc_duration_minutes(s.start_time, s.end_time)
-        changed = True
+        changes["duration_min"] = calc_duration_minutes(
+            changes.get("start_time", s.start_time), changes.get("end_time", s.end_time)
+        )
 
-    if not changed:
+    if not changes:
         print("Nothing to update. Provide fields to edit.")
         return
 
-    s.currency = str(cfg.get("currency", s.currency))
-    s.updated_at = now_iso_local()
-    save_sessions(data_path, sessions)
+    changes["currency"] = str(cfg.get("currency", s.currency))
+    changes["updated_at"] = now_iso_local()
+    s = replace(s, **changes)  # new object; __post_init__ refreshes _date_ord
+    append_journal(data_path, {"op": "upd", "session": s})
+    sessions.add(s)  # swaps it in and re-indexes the date-sorted view
 
     print(f"Updated session #{s.id}: {s.date} {s.stake} {s.game} {s.start_time}-{s.end_time} "
           f"({s.duration_min}m) Profit: {fmt_money(s.profit)} {s.currency}")
 
 
-def cmd_delete(args: argparse.Namespace, sessions: List[Session], data_path: Path) -> None:
+def cmd_delete(args: argparse.Namespace, sessions: SessionStore, data_path: Path) -> None:
     sid = args.id
-    before = len(sessions)
-    sessions[:] = [s for s in sessions if s.id != sid]
-    if len(sessions) == before:
+    if sid not in sessions.by_id:
         raise TrackerError(f"session id {sid} not found")
-    save_sessions(data_path, sessions)
+    append_journal(data_path, {"op": "del", "id": sid})
+    sessions.remove(sid)
     print(f"Deleted session #{sid}.")
 
 
-def cmd_export(args: argparse.Namespace, sessions: List[Session]) -> None:
+def cmd_compact(sessions: SessionStore, data_path: Path) -> None:
+    save_sessions(data_path, sessions)
+    print(f"Compacted {len(sessions)} sessions into {data_path.name}")
+
+
+def cmd_export(args: argparse.Namespace, sessions: SessionStore) -> None:
     fmt = (args.format or "csv").lower().strip()
     if fmt != "csv":
         raise TrackerError("only csv export is supported")
 
     out_path = Path(args.out or "sessions_export.csv").resolve()
 
-    # union of keys
-    rows = [s.to_dict() for s in sessions]
-    if not rows:
-        # still export header
-        fieldnames = list(Session.__dataclass_fields__.keys())
-    else:
-        # keep stable ordering based on dataclass
-        fieldnames = list(Session.__dataclass_fields__.keys())
+    # keep stable ordering based on dataclass (header is written even with no rows)
+    fieldnames = list(SESSION_FIELDS)
+    # rows as tuples straight from the attributes; no per-row dict like DictWriter
+    row_of = attrgetter(*fieldnames)
 
-    with out_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+    with out_path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        # id order, as rows were appended before the snapshot was kept date-sorted
+        w.writerows(map(row_of, sorted(sessions, key=attrgetter("id"))))
 
     print(f"Exported {len(sessions)} sessions to {out_path}")
 
 
 def cmd_config(args: argparse.Namespace, cfg: Dict[str, Any], cfg_path: Path) -> None:
     if args.set is None:
-        print(json.dumps(cfg, ensure_ascii=False, indent=2))
+        print(json_dumps(cfg, pretty=args.pretty).decode("utf-8"))
         return
 
     if "=" not in args.set:
@@ -614,10 +846,90 @@ def cmd_config(args: argparse.Namespace, cfg: Dict[str, Any], cfg_path: Path) ->
     else:
         cfg[key] = value
 
-    cfg_path.write_text(json.dumps(cfg, ensure_ascii=False, indent=2), encoding="utf-8")
+    cfg_path.write_bytes(json_dumps(cfg))
     print(f"Config updated: {key}={value}")
 
 
+def run_line(
+    parser: argparse.ArgumentParser,
+    line: str,
+    cfg: Dict[str, Any],
+    cfg_path: Path,
+    sessions: SessionStore,
+    data_path: Path,
+) -> bool:
+    # one command line for batch/shell; returns False on an argparse error
+    argv = shlex.split(line, comments=True)  # ValueError on unbalanced quotes
+    if not argv:
+        return True
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        # argparse has already printed usage/help
+        return not e.code
+    if args.command in ("batch", "shell"):
+        raise TrackerError(f"{args.command} cannot be nested")
+    if args.command == "add" and not sys.stdin.isatty() and any(getattr(args, k) is None for k in ADD_REQUIRED):
+        # prompts would consume the following command lines as answers
+        raise TrackerError("add needs " + ", ".join(f"--{k}" for k in ADD_REQUIRED) + " when commands come from stdin")
+    dispatch(parser, args, cfg, cfg_path, sessions, data_path)
+    return True
+
+
+def cmd_batch(
+    parser: argparse.ArgumentParser,
+    cfg: Dict[str, Any],
+    cfg_path: Path,
+    sessions: SessionStore,
+    data_path: Path,
+) -> None:
+    # one process, one load: run newline-delimited commands from stdin
+    failed = 0
+    for lineno, line in enumerate(sys.stdin, 1):
+        try:
+            if not run_line(parser, line, cfg, cfg_path, sessions, data_path):
+                failed += 1
+        except (TrackerError, ValueError) as e:
+            print(f"Error: line {lineno}: {e}", file=sys.stderr)
+            failed += 1
+
+    if failed:
+        raise TrackerError(f"{failed} batch command(s) failed")
+
+
+def cmd_shell(
+    parser: argparse.ArgumentParser,
+    cfg: Dict[str, Any],
+    cfg_path: Path,
+    sessions: SessionStore,
+    data_path: Path,
+) -> None:
+    # parser built and data loaded once; every line is a regular tracker command
+    interactive = sys.stdin.isatty()
+    if interactive:
+        print("PokerOK tracker shell. Type commands as on the command line; :save to compact, :quit to exit.")
+    try:
+        while True:
+            try:
+                line = input("tracker> " if interactive else "")
+            except EOFError:
+                break
+            cmd = line.strip()
+            if cmd in (":quit", ":q", "exit", "quit"):
+                break
+            if cmd == ":save":
+                cmd_compact(sessions, data_path)
+                continue
+            try:
+                run_line(parser, line, cfg, cfg_path, sessions, data_path)
+            except (TrackerError, ValueError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+    finally:
+        # changes are journaled as they happen; fold them into the snapshot on exit
+        if journal_path(data_path).exists():
+            save_sessions(data_path, sessions)
+
+
 # ---------------------------
 # Argparse
 # ---------------------------
@@ -634,11 +946,11 @@ def build_parser() -> argparse.ArgumentParser:
     pa.add_argument("--date", help="YYYY-MM-DD")
     pa.add_argument("--start", help="HH:MM")
     pa.add_argument("--end", help="HH:MM")
-    pa.add_argument("--profit", help="Profit number, e.g. 12.5 or -7.25")
+    pa.add_argument("--profit", type=arg_type(parse_float), help="Profit number, e.g. 12.5 or -7.25")
     pa.add_argument("--stake", help="Stake, e.g. NL10, PLO25")
     pa.add_argument("--game", help="Game type: NLH or PLO")
-    pa.add_argument("--hands", help="Hands count (optional)")
-    pa.add_argument("--tables", help="Tables count (optional)")
+    pa.add_argument("--hands", type=arg_type(lambda x: parse_nonneg_int(x, "hands")), help="Hands count (optional)")
+    pa.add_argument("--tables", type=arg_type(lambda x: parse_nonneg_int(x, "tables")), help="Tables count (optional)")
     pa.add_argument("--notes", help="Notes (optional)")
     pa.set_defaults(func="add")
 
@@ -670,11 +982,11 @@ def build_parser() -> argparse.ArgumentParser:
     pe.add_argument("--date", help="YYYY-MM-DD")
     pe.add_argument("--start", help="HH:MM")
     pe.add_argument("--end", help="HH:MM")
-    pe.add_argument("--profit", help="Profit number")
+    pe.add_argument("--profit", type=arg_type(parse_float), help="Profit number")
     pe.add_argument("--stake", help="Stake")
     pe.add_argument("--game", help="Game")
-    pe.add_argument("--hands", help="Hands (>=0)")
-    pe.add_argument("--tables", help="Tables (>=0)")
+    pe.add_argument("--hands", type=arg_type(lambda x: parse_nonneg_int(x, "hands")), help="Hands (>=0)")
+    pe.add_argument("--tables", type=arg_type(lambda x: parse_nonneg_int(x, "tables")), help="Tables (>=0)")
     pe.add_argument("--notes", help="Notes (set empty string to clear)")
     pe.set_defaults(func="edit")
 
@@ -689,9 +1001,22 @@ def build_parser() -> argparse.ArgumentParser:
     px.add_argument("--out", default="sessions_export.csv", help="Output filename (default sessions_export.csv)")
     px.set_defaults(func="export")
 
+    # compact
+    pk = sub.add_parser("compact", help="Fold the change journal back into the sessions file.")
+    pk.set_defaults(func="compact")
+
+    # batch
+    pb = sub.add_parser("batch", help="Run commands from stdin (one per line), loading data only once.")
+    pb.set_defaults(func="batch")
+
+    # shell
+    psh = sub.add_parser("shell", help="Interactive shell: run many commands with data loaded once.")
+    psh.set_defaults(func="shell")
+
     # config
     pc = sub.add_parser("config", help="Show or update config.")
     pc.add_argument("--set", help="Set config key=value (e.g., currency=EUR)")
+    pc.add_argument("--pretty", action="store_true", help="Show config as indented JSON")
     pc.set_defaults(func="config")
 
     return p
@@ -701,6 +1026,34 @@ def build_parser() -> argparse.ArgumentParser:
 # Main
 # ---------------------------
 
+def dispatch(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    cfg: Dict[str, Any],
+    cfg_path: Path,
+    sessions: SessionStore,
+    data_path: Path,
+) -> None:
+    if args.command == "add":
+        cmd_add(args, cfg, sessions, data_path)
+    elif args.command == "list":
+        cmd_list(args, sessions)
+    elif args.command == "stats":
+        cmd_stats(args, cfg, sessions)
+    elif args.command == "edit":
+        cmd_edit(args, cfg, sessions, data_path)
+    elif args.command == "delete":
+        cmd_delete(args, sessions, data_path)
+    elif args.command == "export":
+        cmd_export(args, sessions)
+    elif args.command == "compact":
+        cmd_compact(sessions, data_path)
+    elif args.command == "config":
+        cmd_config(args, cfg, cfg_path)
+    else:
+        parser.print_help()
+
+
 def main(argv: Optional[List[str]] = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
@@ -713,22 +1066,12 @@ def main(argv: Optional[List[str]] = None) -> None:
         data_path = base / str(cfg.get("data_file", "sessions.json"))
         sessions = load_or_init_sessions(data_path)
 
-        if args.command == "add":
-            cmd_add(args, cfg, sessions, data_path)
-        elif args.command == "list":
-            cmd_list(args, sessions)
-        elif args.command == "stats":
-            cmd_stats(args, cfg, sessions)
-        elif args.command == "edit":
-            cmd_edit(args, cfg, sessions, data_path)
-        elif args.command == "delete":
-            cmd_delete(args, sessions, data_path)
-        elif args.command == "export":
-            cmd_export(args, sessions)
-        elif args.command == "config":
-            cmd_config(args, cfg, cfg_path)
+        if args.command == "batch":
+            cmd_batch(parser, cfg, cfg_path, sessions, data_path)
+        elif args.command == "shell":
+            cmd_shell(parser, cfg, cfg_path, sessions, data_path)
         else:
-            parser.print_help()
+            dispatch(parser, args, cfg, cfg_path, sessions, data_path)
 
     except TrackerError as e:
         die(str(e), 1)